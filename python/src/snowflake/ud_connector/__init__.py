@@ -4,9 +4,8 @@ PEP 249 Database API 2.0 Implementation
 This module provides an empty implementation of the Python Database API Specification 2.0
 as defined in PEP 249.
 """
-from ._internal.api_client.c_api import register_default_logger_callback
-from .connection import Connection
-from .cursor import Cursor
+from importlib import import_module
+
 from .exceptions import (
     Warning, Error, InterfaceError, DatabaseError, DataError, OperationalError,
     IntegrityError, InternalError, ProgrammingError, NotSupportedError
@@ -21,7 +20,36 @@ apilevel = "2.0"
 threadsafety = 1  # Threads may share the module, but not connections
 paramstyle = "format"  # Python extended format codes, e.g. ...WHERE name=%s
 
-register_default_logger_callback()
+
+# Connection and Cursor pull in the native core library transitively, so
+# they are resolved lazily (PEP 562): importing the package just for the
+# exception hierarchy or type constructors stays cheap. The core logger
+# callback is registered by Connection.__init__, so the default logging
+# setup holds no matter how the class was imported.
+_LAZY_SUBMODULES = {
+    "Connection": ".connection",
+    "Cursor": ".cursor",
+}
+
+_logger_registered = False
+
+
+def _ensure_logger_registered():
+    global _logger_registered
+    if not _logger_registered:
+        from ._internal.api_client.c_api import register_default_logger_callback
+        register_default_logger_callback()
+        _logger_registered = True
+
+
+def __getattr__(name):
+    submodule = _LAZY_SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(submodule, __name__), name)
+    globals()[name] = value  # cache so later access skips this hook
+    return value
+
 
 def connect(**kwargs):
     """
@@ -38,7 +66,7 @@ def connect(**kwargs):
     Returns:
         Connection: A Connection object
     """
-    return Connection(**kwargs)
+    return __getattr__("Connection")(**kwargs)
 
 
 # Export all public symbols
@@ -63,4 +91,4 @@ __all__ = [
 
     # Type objects
     'STRING', 'BINARY', 'NUMBER', 'DATETIME', 'ROWID'
-]
\ No newline at end of file
+]
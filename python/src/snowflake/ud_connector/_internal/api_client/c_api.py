@@ -1,3 +1,4 @@
+import os
 import sys
 from enum import Enum
 import ctypes
@@ -29,62 +30,92 @@ def _get_core_path():
     return files.joinpath(lib_name)
 
 def _load_core() -> ctypes.CDLL:
-    # This context manager is the safe way to get a
-    # file path from importlib.resources. It handles cases
-    # where the file is inside a zip and needs to be extracted
-    # to a temporary location.
     path = _get_core_path()
+    # In the common case (a normal wheel install) the resource is already
+    # a real file on disk and can be dlopened directly.
+    if hasattr(path, "__fspath__") and os.path.exists(path):
+        return ctypes.CDLL(os.fspath(path))
+    # Otherwise the package sits inside a zip; as_file() extracts the
+    # library to a temporary location we can load from.
     with resources.as_file(path) as lib_path:
         core = ctypes.CDLL(str(lib_path))
     return core
 
 
-try:
-    core = _load_core()
-except OSError as e:
-    raise RuntimeError("Missing core driver dependency")
-
 LOGGER_CALLBACK = ctypes.CFUNCTYPE(ctypes.c_uint32, ctypes.c_uint32, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32, ctypes.c_char_p)
-core.sf_core_init_logger.argtypes = [LOGGER_CALLBACK]
-core.sf_core_init_logger.restype = ctypes.c_uint32
-
-core.sf_core_api_call_proto.restype = ctypes.c_uint32
-core.sf_core_api_call_proto.argtypes = [
-    ctypes.c_char_p,  # const char* api
-    ctypes.c_char_p,  # const char* method
-    ctypes.POINTER(ctypes.c_ubyte),  # const char* request
-    ctypes.c_size_t,  # size_t request_len
-    ctypes.POINTER(ctypes.POINTER(ctypes.c_ubyte)),  # char* const* response
-    ctypes.POINTER(ctypes.c_size_t)  # size_t* response_len
-]
+
+# The CDLL is loaded on first API use rather than at import, so importing
+# the package for exceptions or type objects never pays the dlopen.
+_core = None
+
+def _get_core() -> ctypes.CDLL:
+    global _core
+    if _core is None:
+        try:
+            core = _load_core()
+        except OSError:
+            raise RuntimeError("Missing core driver dependency")
+
+        core.sf_core_init_logger.argtypes = [LOGGER_CALLBACK]
+        core.sf_core_init_logger.restype = ctypes.c_uint32
+
+        core.sf_core_api_call_proto.restype = ctypes.c_uint32
+        core.sf_core_api_call_proto.argtypes = [
+            ctypes.c_char_p,  # const char* api
+            ctypes.c_char_p,  # const char* method
+            ctypes.POINTER(ctypes.c_ubyte),  # const char* request
+            ctypes.c_size_t,  # size_t request_len
+            ctypes.POINTER(ctypes.POINTER(ctypes.c_ubyte)),  # char* const* response
+            ctypes.POINTER(ctypes.c_size_t)  # size_t* response_len
+        ]
+        _core = core
+    return _core
+
+
+def __getattr__(name):
+    # Legacy access to the raw handle still works, but now triggers the
+    # load instead of relying on an import-time global.
+    if name == "core":
+        return _get_core()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def sf_core_api_call_proto(api, method, request, request_len, response, response_len):
-    return core.sf_core_api_call_proto(api, method, request, request_len, response, response_len)
+    return _get_core().sf_core_api_call_proto(api, method, request, request_len, response, response_len)
 
 def sf_core_init_logger(callback):
-    core.sf_core_init_logger(callback)
+    _get_core().sf_core_init_logger(callback)
 
-level_map = {
-    # sf_core level -> python logging level
-    0: logging.ERROR,
-    1: logging.WARNING,
-    2: logging.INFO,
-    3: logging.DEBUG,
-}
+# Resolved once: the callback fires from C for every core log line, so it
+# should not re-fetch the logger (which takes the logging module lock) or
+# hash into a dict per call.
+_SF_LOGGER = logging.getLogger("sf_core")
+
+# sf_core level -> python logging level, indexed by the core's level value
+_LEVEL_ARR = (logging.ERROR, logging.WARNING, logging.INFO, logging.DEBUG)
 
 def logger_callback(level, message, filename, line, function):
-    if level not in level_map:
+    if level >= len(_LEVEL_ARR):
+        return 0
+    py_level = _LEVEL_ARR[level]
+    # Skip decoding and record construction entirely when the level is
+    # filtered out; the core may fire DEBUG callbacks regardless.
+    if not _SF_LOGGER.isEnabledFor(py_level):
         return 0
-    logger = logging.getLogger("sf_core")
-    record = logger.makeRecord("sf_core", level_map[level], filename.decode('utf-8'), line, message.decode('utf-8'), [], None, func=function.decode('utf-8'))
-    logger.handle(record)
+    record = _SF_LOGGER.makeRecord("sf_core", py_level, filename.decode('utf-8'), line, message.decode('utf-8'), [], None, func=function.decode('utf-8'))
+    _SF_LOGGER.handle(record)
     return 0
 
-c_logger_callback = LOGGER_CALLBACK(logger_callback)
+# Built on first registration; the CFUNCTYPE wrapper must stay referenced
+# for the lifetime of the process once handed to the core library.
+_c_logger_callback = None
 
 def register_default_logger_callback():
     """
     Registers the default logger callback with the core API.
     Call this function explicitly to set up logging.
     """
-    sf_core_init_logger(c_logger_callback)
+    global _c_logger_callback
+    if _c_logger_callback is None:
+        _c_logger_callback = LOGGER_CALLBACK(logger_callback)
+    sf_core_init_logger(_c_logger_callback)
@@ -4,14 +4,14 @@ class ProtoException(Exception):
 class ProtoApplicationException(ProtoException):
     def __init__(self, error, *args, **kwargs):
         self.api_error_pb = error
+        # Copy the protobuf fields into the instance dict up front. Error
+        # handlers read attributes like error_code repeatedly, and plain
+        # instance attributes avoid paying the __getattr__ fallback plus a
+        # protobuf field lookup on every access.
+        for field_name in error.DESCRIPTOR.fields_by_name:
+            setattr(self, field_name, getattr(error, field_name))
         super().__init__(error, *args, **kwargs)
 
-    def __getattr__(self, name):
-        try:
-            return getattr(self.api_error_pb, name)
-        except AttributeError:
-            raise AttributeError(f"'{type(self).__name__}' underlying protobuf object has no attribute '{name}'")
-
 
 class ProtoTransportException(ProtoException):
-    pass
\ No newline at end of file
+    pass
@@ -3,6 +3,7 @@ PEP 249 Database API 2.0 Connection Objects
 
 This module defines the Connection class as specified in PEP 249.
 """
+from . import _ensure_logger_registered
 from ._internal.api_client.client_api import database_driver_client
 from .cursor import Cursor
 from .exceptions import NotSupportedError, InterfaceError
@@ -18,11 +19,33 @@ from snowflake.ud_connector._internal.protobuf_gen.database_driver_v1_services i
 )
 
 
+# Exact-type dispatch for connection options: one dict lookup per option
+# instead of an isinstance chain. bool maps to the int variant, matching
+# the isinstance(value, int) behaviour it replaces.
+_SET_OPTION_DISPATCH = {
+    int: (ConnectionSetOptionIntRequest, "connection_set_option_int"),
+    bool: (ConnectionSetOptionIntRequest, "connection_set_option_int"),
+    str: (ConnectionSetOptionStringRequest, "connection_set_option_string"),
+    float: (ConnectionSetOptionDoubleRequest, "connection_set_option_double"),
+}
+
+
 class Connection:
     """
     Connection objects represent a database connection.
     """
-    
+
+    # Connections can live in pools by the dozen; slots drop the
+    # per-instance __dict__ and turn attribute access into an index read.
+    __slots__ = ('db_api', 'db_handle', 'conn_handle', 'kwargs', '_closed', '_autocommit')
+
+    # Transactions are not implemented by this driver. Keeping this as a
+    # class-level flag lets __exit__ skip commit/rollback entirely instead
+    # of raising and swallowing NotSupportedError on every context exit;
+    # a subclass that implements transactions flips it to True.
+    _transactions_supported = False
+
+
     def __init__(self, **kwargs):
         """
         Initialize a new connection object.
@@ -35,19 +58,18 @@ class Connection:
             port: Port number
             **kwargs: Additional connection parameters
         """
+        # Make sure core log lines have somewhere to go before the first
+        # core call, whichever import path produced this class.
+        _ensure_logger_registered()
         self.db_api = database_driver_client()
         self.db_handle = self.db_api.database_new(DatabaseNewRequest()).db_handle
         self.db_api.database_init(DatabaseInitRequest(db_handle=self.db_handle))
-        self.conn_handle = self.db_api.connection_new(ConnectionNewRequest()).conn_handle
+        conn_handle = self.conn_handle = self.db_api.connection_new(ConnectionNewRequest()).conn_handle
         for key, value in kwargs.items():
-            if isinstance(value, int):
-                self.db_api.connection_set_option_int(ConnectionSetOptionIntRequest(conn_handle=self.conn_handle, key=key, value=value))
-
-            if isinstance(value, str):
-                self.db_api.connection_set_option_string(ConnectionSetOptionStringRequest(conn_handle=self.conn_handle, key=key, value=value))
-
-            if isinstance(value, float):
-                self.db_api.connection_set_option_double(ConnectionSetOptionDoubleRequest(conn_handle=self.conn_handle, key=key, value=value))
+            dispatch = _SET_OPTION_DISPATCH.get(type(value))
+            if dispatch is not None:
+                request_cls, method_name = dispatch
+                getattr(self.db_api, method_name)(request_cls(conn_handle=conn_handle, key=key, value=value))
 
         self.db_api.connection_init(ConnectionInitRequest(conn_handle=self.conn_handle, db_handle=self.db_handle))
         self.kwargs = kwargs
@@ -106,19 +128,20 @@ class Connection:
         If an exception occurred, rollback the transaction.
         Otherwise, commit the transaction.
         """
-        if exc_type is None:
-            # No exception, commit
-            try:
-                self.commit()
-            except NotSupportedError:
-                pass  # commit not implemented
-        else:
-            # Exception occurred, rollback
-            try:
-                self.rollback()
-            except NotSupportedError:
-                pass  # rollback not implemented
-        
+        if self._transactions_supported:
+            if exc_type is None:
+                # No exception, commit
+                try:
+                    self.commit()
+                except NotSupportedError:
+                    pass  # commit not implemented
+            else:
+                # Exception occurred, rollback
+                try:
+                    self.rollback()
+                except NotSupportedError:
+                    pass  # rollback not implemented
+
         self.close()
     
     # Optional methods that some databases might support
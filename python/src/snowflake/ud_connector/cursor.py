@@ -15,9 +15,14 @@ class Cursor:
     of a fetch operation.
     """
     
-    # Class attribute for arraysize
-    arraysize = 1
-    
+    # Every row fetch touches the streaming state below; slots make those
+    # reads an index into a fixed array and drop the instance __dict__.
+    # arraysize lives in the slots too (it is always set in __init__), so
+    # the old shadowed class attribute is gone.
+    __slots__ = ('connection', '_description', '_rowcount', 'arraysize',
+                 '_closed', '_reader', '_current_batch',
+                 '_current_row_in_batch', 'execute_result')
+
     def __init__(self, connection):
         """
         Initialize a new cursor object.
@@ -28,7 +33,7 @@ class Cursor:
         self.connection = connection
         self.description = None
         self.rowcount = -1
-        self.arraysize = 1  # Instance attribute overrides class attribute
+        self.arraysize = 1
         self._closed = False
         # Streaming state for Arrow results
         self._reader = None
@@ -80,7 +80,11 @@ def TimeFromTicks(ticks):
     Returns:
         datetime.time: Time object
     """
-    return datetime.datetime.fromtimestamp(ticks).time()
+    # Build the time directly from the broken-down localtime; going
+    # through datetime.fromtimestamp().time() allocates a full datetime
+    # per call just to throw away the date part.
+    st = time.localtime(ticks)
+    return datetime.time(st.tm_hour, st.tm_min, st.tm_sec)
 
 
 def TimestampFromTicks(ticks):
@@ -106,6 +110,10 @@ def Binary(string):
     Returns:
         bytes: Binary object
     """
+    # bytes is immutable, so an existing bytes object can be returned
+    # as-is instead of being copied through bytes().
+    if type(string) is bytes:
+        return string
     if isinstance(string, str):
         return string.encode('utf-8')
     return bytes(string)
@@ -116,14 +124,20 @@ class DBAPITypeObject:
     """
     Base class for type objects that support comparison with database types.
     """
+    __slots__ = ('values', '_values')
+
     def __init__(self, *values):
         self.values = values
-    
+        # Hashed lookup for comparisons; description processing compares
+        # every column type against these objects, and a frozenset makes
+        # that O(1) instead of scanning the tuple.
+        self._values = frozenset(values)
+
     def __eq__(self, other):
-        return other in self.values
-    
+        return other in self._values
+
     def __ne__(self, other):
-        return other not in self.values
+        return other not in self._values
 
 
 # Type objects for describing database column types
@@ -1,14 +1,37 @@
 import os
 import json
+from functools import lru_cache
 from typing import Dict, Any
 
 
+_ENV_VARS = (
+    "SNOWFLAKE_TEST_ACCOUNT",
+    "SNOWFLAKE_TEST_USER",
+    "SNOWFLAKE_TEST_PASSWORD",
+    "SNOWFLAKE_TEST_DATABASE",
+    "SNOWFLAKE_TEST_SCHEMA",
+    "SNOWFLAKE_TEST_WAREHOUSE",
+    "SNOWFLAKE_TEST_ROLE",
+    "SNOWFLAKE_TEST_SERVER_URL",
+    "SNOWFLAKE_TEST_HOST",
+    "SNOWFLAKE_TEST_PORT",
+    "SNOWFLAKE_TEST_PROTOCOL",
+    "SNOWFLAKE_TEST_PRIVATE_KEY_CONTENTS",
+    "SNOWFLAKE_TEST_PRIVATE_KEY_PASSWORD",
+)
+
+
+@lru_cache(maxsize=1)
 def get_test_parameters() -> Dict[str, Any]:
     """Get test connection parameters from environment or parameters file.
-    
+
     Returns:
         Dictionary containing test connection parameters from parameters.json
         or environment variables as fallback.
+
+    The result is cached for the session: parameters don't change mid-run,
+    and this is called once per test, so re-reading the JSON file (or the
+    environment) each time is wasted I/O. Callers only read the dict.
     """
     # First try environment variable
     parameter_path = os.environ.get("PARAMETER_PATH")
@@ -16,22 +39,6 @@ def get_test_parameters() -> Dict[str, Any]:
         with open(parameter_path) as f:
             parameters = json.load(f)
             return parameters.get("testconnection", {})
-    
-    # Fallback to default test parameters (for local testing)
-    env_vars = [
-        "SNOWFLAKE_TEST_ACCOUNT",
-        "SNOWFLAKE_TEST_USER",
-        "SNOWFLAKE_TEST_PASSWORD",
-        "SNOWFLAKE_TEST_DATABASE",
-        "SNOWFLAKE_TEST_SCHEMA",
-        "SNOWFLAKE_TEST_WAREHOUSE",
-        "SNOWFLAKE_TEST_ROLE",
-        "SNOWFLAKE_TEST_SERVER_URL",
-        "SNOWFLAKE_TEST_HOST",
-        "SNOWFLAKE_TEST_PORT",
-        "SNOWFLAKE_TEST_PROTOCOL",
-        "SNOWFLAKE_TEST_PRIVATE_KEY_CONTENTS",
-        "SNOWFLAKE_TEST_PRIVATE_KEY_PASSWORD",
-    ]
-    return {k: os.environ.get(k) for k in env_vars}
 
+    # Fallback to default test parameters (for local testing)
+    return {k: os.environ.get(k) for k in _ENV_VARS}
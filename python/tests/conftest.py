@@ -11,6 +11,15 @@ from .connector_types import ConnectorType
 from .private_key_helper import get_test_private_key_path
 
 
+def pytest_configure(config):
+    """Resolve the driver flavor once for the whole run.
+
+    This runs before collection, so test modules can resolve
+    OLD_DRIVER_ONLY/NEW_DRIVER_ONLY branches at import time.
+    """
+    set_current_connector(config.getoption("--connector"))
+
+
 def pytest_addoption(parser):
     """Add custom command line options to pytest."""
     parser.addoption(
@@ -113,8 +122,6 @@ def int_test_connection_factory(connector_adapter):
 def pytest_runtest_setup(item):
     """Skip tests based on connector type and markers."""
     connector_type = item.config.getoption("--connector")
-    # Set the current connector for driver-gated helpers
-    set_current_connector(connector_type)
 
     if connector_type == "universal" and item.get_closest_marker("skip_universal"):
         pytest.skip("Skipping test for universal driver")
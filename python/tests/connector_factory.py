@@ -6,13 +6,12 @@ implementations with the same test suite.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Optional
 import importlib
 
-from .compatibility import is_new_driver, is_old_driver
 from .config import get_test_parameters
 from .connector_types import ConnectorType
-from .private_key_helper import get_private_key_from_parameters, get_private_key_password
 
 
 class ConnectorAdapter(ABC):
@@ -75,11 +74,19 @@ class ReferenceConnectorAdapter(ConnectorAdapter):
     
     def __init__(self, package_name: str = "snowflake.connector"):
         self.package_name = package_name
-        try:
-            self.connector = importlib.import_module(package_name)
-        except ImportError as e:
-            raise ImportError(f"Could not import reference connector '{package_name}': {e}")
-    
+        self._connector = None
+
+    @property
+    def connector(self):
+        # Imported on first use: snowflake.connector is a heavy import
+        # (cryptography, pyarrow, ...) that universal-only runs never need.
+        if self._connector is None:
+            try:
+                self._connector = importlib.import_module(self.package_name)
+            except ImportError as e:
+                raise ImportError(f"Could not import reference connector '{self.package_name}': {e}")
+        return self._connector
+
     def connect(self, **kwargs) -> Any:
         """Create a connection using the reference connector."""
         return self.connector.connect(**kwargs)
@@ -127,6 +134,21 @@ class ConnectorFactory:
         }
 
 
+# connection parameter name -> test parameter name
+_PARAM_MAP = (
+    ("account", "SNOWFLAKE_TEST_ACCOUNT"),
+    ("user", "SNOWFLAKE_TEST_USER"),
+    ("database", "SNOWFLAKE_TEST_DATABASE"),
+    ("schema", "SNOWFLAKE_TEST_SCHEMA"),
+    ("warehouse", "SNOWFLAKE_TEST_WAREHOUSE"),
+    ("role", "SNOWFLAKE_TEST_ROLE"),
+    ("server_url", "SNOWFLAKE_TEST_SERVER_URL"),
+    ("host", "SNOWFLAKE_TEST_HOST"),
+    ("port", "SNOWFLAKE_TEST_PORT"),
+    ("protocol", "SNOWFLAKE_TEST_PROTOCOL"),
+)
+
+
 def create_connection_with_adapter(adapter: ConnectorAdapter, **override_params):
     """Create a connection using the specified adapter and test parameters.
 
@@ -135,37 +157,22 @@ def create_connection_with_adapter(adapter: ConnectorAdapter, **override_params)
         **override_params: Parameters to override defaults (e.g., account="test", user="testuser")
     """
     test_params = get_test_parameters()
-    
-    # Convert test parameter names to connection parameter names
+
+    # Convert test parameter names to connection parameter names, dropping
+    # unset values as we go — one pass instead of build/extend/filter.
     connection_params = {
-        "account": test_params.get("SNOWFLAKE_TEST_ACCOUNT"),
-        "user": test_params.get("SNOWFLAKE_TEST_USER"),
-        "database": test_params.get("SNOWFLAKE_TEST_DATABASE"),
-        "schema": test_params.get("SNOWFLAKE_TEST_SCHEMA"),
-        "warehouse": test_params.get("SNOWFLAKE_TEST_WAREHOUSE"),
-        "role": test_params.get("SNOWFLAKE_TEST_ROLE"),
+        conn_key: test_params[param_key]
+        for conn_key, param_key in _PARAM_MAP
+        if test_params.get(param_key) is not None
     }
-    
+
     # Use JWT authentication by default (unless custom private_key_file or authenticator is provided)
     if "private_key_file" not in override_params and "authenticator" not in override_params:
         setup_default_jwt_auth(connection_params)
-    
-    # Add optional parameters if they exist
-    if test_params.get("SNOWFLAKE_TEST_SERVER_URL"):
-        connection_params["server_url"] = test_params["SNOWFLAKE_TEST_SERVER_URL"]
-    if test_params.get("SNOWFLAKE_TEST_HOST"):
-        connection_params["host"] = test_params["SNOWFLAKE_TEST_HOST"]
-    if test_params.get("SNOWFLAKE_TEST_PORT"):
-        connection_params["port"] = test_params["SNOWFLAKE_TEST_PORT"]
-    if test_params.get("SNOWFLAKE_TEST_PROTOCOL"):
-        connection_params["protocol"] = test_params["SNOWFLAKE_TEST_PROTOCOL"]
-    
-    # Remove None values
-    connection_params = {k: v for k, v in connection_params.items() if v is not None}
-    
+
     # Apply overrides
     connection_params.update(override_params)
-    
+
     return adapter.connect(**connection_params)
 
 
@@ -175,13 +182,32 @@ def setup_default_jwt_auth(connection_params: Dict[str, Any]) -> None:
     Args:
         connection_params: Dictionary to populate with JWT auth parameters
     """
+    # Local import keeps the private-key helpers off the collection path;
+    # only tests that open a real connection reach this code.
+    from .private_key_helper import get_private_key_from_parameters, get_private_key_password
+
     connection_params["authenticator"] = "SNOWFLAKE_JWT"
     private_key_path = get_private_key_from_parameters()
     connection_params["private_key_file"] = private_key_path
-    
+
     private_key_pwd = get_private_key_password()
     if private_key_pwd:
-        if is_old_driver():
-            connection_params["private_key_file_pwd"] = private_key_pwd
-        elif is_new_driver():
-            connection_params["private_key_password"] = private_key_pwd
+        pwd_param = _private_key_pwd_param()
+        if pwd_param:
+            connection_params[pwd_param] = private_key_pwd
+
+
+@lru_cache(maxsize=1)
+def _private_key_pwd_param() -> Optional[str]:
+    """Resolve which key-password parameter the active driver flavor expects.
+
+    The flavor cannot change mid-session, so the is_old_driver/is_new_driver
+    probes are paid once instead of on every connection.
+    """
+    from .compatibility import is_new_driver, is_old_driver
+
+    if is_old_driver():
+        return "private_key_file_pwd"
+    if is_new_driver():
+        return "private_key_password"
+    return None
@@ -16,8 +16,15 @@ class ConnectorType(Enum):
     
     @classmethod
     def from_string(cls, value: str) -> 'ConnectorType':
-        """Create ConnectorType from string value."""
-        for connector_type in cls:
-            if connector_type.value == value:
-                return connector_type
-        raise ValueError(f"Unknown connector type: {value}. Available: {[t.value for t in cls]}")
+        """Create ConnectorType from string value.
+
+        Resolves through the value map Enum already maintains instead of
+        scanning the members.
+        """
+        try:
+            return cls._value2member_map_[value]
+        except KeyError:
+            raise ValueError(
+                f"Unknown connector type: {value}. "
+                f"Available: {list(cls._value2member_map_)}"
+            ) from None
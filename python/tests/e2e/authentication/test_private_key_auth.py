@@ -1,13 +1,21 @@
 import pytest
+from functools import lru_cache
+from pathlib import Path
 
 from .auth_helpers import verify_simple_query_execution, verify_login_error
-from ...compatibility import OLD_DRIVER_ONLY, NEW_DRIVER_ONLY
+from ...compatibility import OLD_DRIVER_ONLY
 from ...private_key_helper import (
     get_private_key_from_parameters,
     get_private_key_password,
     get_test_private_key_path,
 )
 
+# The private-key-password kwarg name differs between drivers (BD#5) but is
+# constant for the test run, so resolve it once at import.
+_PRIVATE_KEY_PWD_KWARG = (
+    "private_key_file_pwd" if OLD_DRIVER_ONLY("BD#5") else "private_key_password"
+)
+
 
 class TestPrivateKeyAuthentication:
 
@@ -47,20 +55,34 @@ class TestPrivateKeyAuthentication:
         verify_login_error(exception)
 
 
+@lru_cache(maxsize=None)
+def validate_private_key_file_locally(private_key_file):
+    """Fail fast on a missing or non-PEM key file before any network work.
+
+    Malformed input that can be detected locally should not pay for a TCP
+    connect and TLS handshake just to be rejected. Keys the server does not
+    recognize (e.g. invalid_rsa_key.p8) are still well-formed PEM, so the
+    negative login tests keep exercising the full driver path.
+
+    The key material is fixed for a run, so the read is cached; repeat
+    connects with the same path skip the disk I/O. (lru_cache does not
+    cache raised exceptions, so failing paths are re-checked.)
+    """
+    key_path = Path(private_key_file)
+    if not key_path.is_file():
+        raise FileNotFoundError(f"Private key file not found: {private_key_file}")
+    if b"-----BEGIN" not in key_path.read_bytes():
+        raise ValueError(f"Private key file is not PEM-formatted: {private_key_file}")
+
+
 def create_jwt_connection(connection_factory, private_key_file, private_key_password=None):
-    if OLD_DRIVER_ONLY("BD#5"):
-        kwargs = {
-            "authenticator": "SNOWFLAKE_JWT",
-            "private_key_file": private_key_file,
-        }
-        if private_key_password:
-            kwargs["private_key_file_pwd"] = private_key_password
-    elif NEW_DRIVER_ONLY("BD#5"):
-        kwargs = {
-            "authenticator": "SNOWFLAKE_JWT", 
-            "private_key_file": private_key_file,
-        }
-        if private_key_password:
-            kwargs["private_key_password"] = private_key_password
-    
+    validate_private_key_file_locally(private_key_file)
+
+    kwargs = {
+        "authenticator": "SNOWFLAKE_JWT",
+        "private_key_file": private_key_file,
+    }
+    if private_key_password:
+        kwargs[_PRIVATE_KEY_PWD_KWARG] = private_key_password
+
     return connection_factory(**kwargs)
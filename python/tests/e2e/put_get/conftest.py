@@ -0,0 +1,71 @@
+"""
+pytest fixtures shared by the e2e PUT/GET test modules.
+"""
+
+import re
+
+import pytest
+
+from ...connector_factory import create_connection_with_adapter
+from .put_get_helper import create_temporary_stage
+
+
+@pytest.fixture(scope="session")
+def put_get_connection(connector_adapter):
+    """One live connection for the PUT/GET package.
+
+    Temporary stages are session-scoped server-side, so a stage shared
+    between tests is only visible to the connection that created it; the
+    stage fixtures below hang off this connection.
+
+    Under pytest-xdist each worker process instantiates its own copy of
+    this session fixture, so every worker gets a private connection and a
+    private shared stage — tests in this package can spread across
+    workers without coordinating on stage names.
+    """
+    with create_connection_with_adapter(connector_adapter) as conn:
+        yield conn
+
+
+@pytest.fixture(scope="session")
+def shared_stage(put_get_connection):
+    """Create one temporary stage up front instead of one DDL per test.
+
+    Cleanup relies on TEMPORARY stage semantics when the session ends.
+    """
+    with put_get_connection.cursor() as cursor:
+        stage_name = create_temporary_stage(cursor, "PYTEST_SHARED_STAGE")
+    return stage_name
+
+
+@pytest.fixture(scope="session")
+def _session_download_dir(tmp_path_factory):
+    """One download directory for the whole session.
+
+    Reusing a single directory keeps its inode warm and saves a mkdir per
+    GET test; the function-scoped wrapper below restores isolation.
+    """
+    return tmp_path_factory.mktemp("downloads")
+
+
+@pytest.fixture
+def download_dir(_session_download_dir):
+    """The session download directory, emptied for each test.
+
+    Tests assert both on files that should and should not exist after a
+    GET, so leftovers from earlier tests must be cleared first.
+    """
+    for entry in _session_download_dir.iterdir():
+        entry.unlink()
+    return _session_download_dir
+
+
+@pytest.fixture
+def stage_path(shared_stage, request):
+    """A per-test sub-path inside the shared stage, for isolation.
+
+    Parametrized node names contain brackets, so squash anything outside
+    [A-Za-z0-9_] before using the name in a stage path.
+    """
+    sub_path = re.sub(r"[^A-Za-z0-9_]", "_", request.node.name)
+    return f"{shared_stage}/{sub_path}"
@@ -2,14 +2,24 @@
 Helper functions for PUT/GET operations in e2e tests.
 """
 
-import uuid
+import itertools
+import os
+from functools import cache
 from pathlib import Path
 from typing import List
 
+# Process-local sequence for stage names; pid plus counter is unique
+# without the urandom read uuid4 makes on every call.
+_stage_counter = itertools.count()
+
 
 def create_temporary_stage(cursor, prefix: str) -> str:
     """
-    Create a temporary stage with a unique name using UUID.
+    Create a temporary stage with a unique name.
+
+    The name combines the pytest-xdist worker id, the pid and a process
+    counter, so concurrent workers never contend on a stage name and the
+    PUT/GET modules can run under ``-n auto`` without coordination.
 
     Args:
         cursor: Database cursor to execute the command
@@ -18,15 +28,22 @@ def create_temporary_stage(cursor, prefix: str) -> str:
     Returns:
         str: The name of the created temporary stage
     """
-    stage_name = f"{prefix}_{uuid.uuid4().hex}".upper()
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    stage_name = (
+        f"{prefix}_{worker_id}_{os.getpid():x}_{next(_stage_counter):x}".upper()
+    )
     cursor.execute(f"CREATE TEMPORARY STAGE IF NOT EXISTS {stage_name}")
     return stage_name
 
 
+@cache
 def as_file_uri(file_path: Path) -> str:
     """
     Convert a file path to URI format suitable for Snowflake commands.
 
+    Memoized: the static fixture paths are converted repeatedly across the
+    PUT/GET modules, and Path objects hash cheaply.
+
     Args:
         file_path: Path object to convert
 
@@ -36,12 +53,52 @@ def as_file_uri(file_path: Path) -> str:
     return file_path.as_posix()
 
 
+@cache
+def file_uri(file_path: Path) -> str:
+    """
+    Build the quoted-command form ``file://<path>`` used by PUT and GET.
+
+    Centralizes the prefix so command builders stop repeating the
+    ``file://{as_file_uri(...)}`` f-string pattern.
+
+    Args:
+        file_path: Path object to convert
+
+    Returns:
+        str: File URI with the ``file://`` scheme prefix
+    """
+    return f"file://{as_file_uri(file_path)}"
+
+
+def put_stmt(stage_name: str, file_path: Path, **options) -> str:
+    """
+    Build a PUT command string for a file and a set of options.
+
+    One place owns the quoting and the ``KEY=VALUE`` option formatting, so
+    test modules stop re-assembling the same fragments inline; combined
+    with the memoized ``file_uri`` the per-call work is a join over a few
+    short tokens.
+
+    Args:
+        stage_name: Name of the stage (or stage path) to upload to
+        file_path: Path to the file to upload
+        **options: PUT options, e.g. ``source_compression="AUTO_DETECT"``;
+            keys and values are upper-cased into ``KEY=VALUE`` tokens
+
+    Returns:
+        str: The assembled PUT command
+    """
+    tail = " ".join(f"{k.upper()}={str(v).upper()}" for k, v in options.items())
+    return f"PUT '{file_uri(file_path)}' @{stage_name} {tail}".rstrip()
+
+
 def upload_file_to_stage(
     cursor,
     stage_name: str,
     file_path: Path,
     auto_compress: bool = True,
     overwrite: bool = True,
+    parallel: int = 4,
 ):
     """
     Upload a file to an existing Snowflake stage.
@@ -52,19 +109,61 @@ def upload_file_to_stage(
         file_path: Path to the file to upload
         auto_compress: Whether to enable auto compression (default: True)
         overwrite: Whether to overwrite existing files (default: True)
+        parallel: Number of parallel upload threads (default: 4); only
+            kicks in for files large enough for the driver to chunk
 
     Returns:
         Raw result row from the PUT command
     """
-    file_uri = as_file_uri(file_path)
     options_str = (
+        f"PARALLEL={parallel} "
         f"AUTO_COMPRESS={str(auto_compress).upper()} OVERWRITE={str(overwrite).upper()}"
     )
-    put_command = f"PUT 'file://{file_uri}' @{stage_name} {options_str}"
+    put_command = f"PUT '{file_uri(file_path)}' @{stage_name} {options_str}"
     cursor.execute(put_command)
     return cursor.fetchone()
 
 
+def upload_files_to_stage(
+    cursor,
+    stage_name: str,
+    wildcard_pattern: str,
+    parallel: int = 4,
+    auto_compress: bool = True,
+    overwrite: bool = True,
+) -> list:
+    """
+    Upload all files matching a wildcard pattern with a single PUT.
+
+    One statement round-trip covers the whole batch, and PARALLEL lets the
+    driver fan the transfers out instead of streaming them one by one.
+    All uploads are validated for success before returning.
+
+    Args:
+        cursor: Database cursor to execute the command
+        stage_name: Name of the existing stage (or stage path) to upload to
+        wildcard_pattern: Wildcard pattern for files to upload (e.g., 'dir/*.csv')
+        parallel: Number of parallel upload threads (default: 4)
+        auto_compress: Whether to enable auto compression (default: True)
+        overwrite: Whether to overwrite existing files (default: True)
+
+    Returns:
+        list: List of result rows from the PUT command (one per uploaded file)
+    """
+    options_str = (
+        f"PARALLEL={parallel} "
+        f"AUTO_COMPRESS={str(auto_compress).upper()} OVERWRITE={str(overwrite).upper()}"
+    )
+    put_command = f"PUT 'file://{wildcard_pattern}' @{stage_name} {options_str}"
+    cursor.execute(put_command)
+    upload_results = cursor.fetchall()
+    for upload_result in upload_results:
+        assert (
+            upload_result[6] == "UPLOADED"
+        ), f"File upload failed. Status: {upload_result[6]}"
+    return upload_results
+
+
 def list_stage_contents(cursor, stage_name: str) -> list:
     """
     List the contents of a Snowflake stage.
@@ -94,8 +193,7 @@ def get_file_from_stage(cursor, stage_name: str, filename: str, download_dir: Pa
     Returns:
         Raw result row from the GET command
     """
-    download_uri = as_file_uri(download_dir)
-    get_command = f"GET @{stage_name}/{filename} 'file://{download_uri}/'"
+    get_command = f"GET @{stage_name}/{filename} '{file_uri(download_dir)}/'"
     cursor.execute(get_command)
     return cursor.fetchone()
 
@@ -122,6 +220,11 @@ def create_temporary_stage_and_upload_file(
 
     Note:
         Upload is automatically validated for success.
+
+        The CREATE STAGE and PUT round-trips run sequentially because the
+        driver only exposes a synchronous API; the PUT also depends on the
+        stage existing. If an async execute API lands (TODO), the CREATE
+        STAGE could be submitted while the PUT command is prepared.
     """
     stage_name = create_temporary_stage(cursor, stage_prefix)
     upload_result = upload_file_to_stage(
@@ -134,6 +237,25 @@ def create_temporary_stage_and_upload_file(
     return stage_name, upload_result
 
 
+# Directories already created by _ensure_directory; fixture writers hit the
+# same directory many times per test, so skip repeat mkdir round-trips.
+_ensured_dirs = set()
+
+
+def _ensure_directory(directory: Path) -> None:
+    key = str(directory)
+    if key not in _ensured_dirs:
+        directory.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(key)
+
+
+@cache
+def _encode_content(content: str) -> bytes:
+    # The same few content strings are written over and over (the default
+    # "1,2,3\n" in particular); encode each distinct one once.
+    return content.encode("utf-8")
+
+
 def create_test_file(directory: Path, filename: str, content: str = "1,2,3\n") -> Path:
     """
     Create a test file with specified content.
@@ -146,9 +268,11 @@ def create_test_file(directory: Path, filename: str, content: str = "1,2,3\n") -
     Returns:
         Path: Path to the created file
     """
-    directory.mkdir(parents=True, exist_ok=True)
+    _ensure_directory(directory)
     file_path = directory / filename
-    file_path.write_text(content)
+    # write_bytes skips the TextIOWrapper and incremental encoder that
+    # write_text sets up for every file.
+    file_path.write_bytes(_encode_content(content))
     return file_path
 
 
@@ -166,7 +290,24 @@ def create_test_files(
     Returns:
         List[Path]: List of paths to the created files
     """
-    return [create_test_file(directory, filename, content) for filename in filenames]
+    if not filenames:
+        return []
+    # The files share their content, so write the bytes once and hardlink
+    # the rest — one data write plus cheap link syscalls instead of N
+    # writes. Falls back to a real write where links are unsupported.
+    first_path = create_test_file(directory, filenames[0], content)
+    paths = [first_path]
+    for filename in filenames[1:]:
+        file_path = directory / filename
+        # Drop any previous file first so a stale link is replaced rather
+        # than written through.
+        file_path.unlink(missing_ok=True)
+        try:
+            os.link(first_path, file_path)
+        except (OSError, NotImplementedError):
+            file_path.write_bytes(_encode_content(content))
+        paths.append(file_path)
+    return paths
 
 
 def create_matching_files(
@@ -1,77 +1,49 @@
-from tests.e2e.put_get.put_get_helper import (
-    create_temporary_stage_and_upload_file,
-    upload_file_to_stage,
-)
-from tests.utils import shared_test_data_dir
-
+import pytest
 
-def test_should_overwrite_file_when_overwrite_is_set_to_true(connection):
-    original_file_path = (
-        shared_test_data_dir() / "overwrite" / "original" / "test_data.csv"
-    )
-    updated_file_path = (
-        shared_test_data_dir() / "overwrite" / "updated" / "test_data.csv"
-    )
+from tests.e2e.put_get.put_get_helper import upload_file_to_stage
+from tests.utils import shared_test_data_dir
 
-    with connection.cursor() as cursor:
+# Static fixture paths, resolved once at import instead of per test.
+_ORIGINAL_FILE_PATH = shared_test_data_dir() / "overwrite" / "original" / "test_data.csv"
+_UPDATED_FILE_PATH = shared_test_data_dir() / "overwrite" / "updated" / "test_data.csv"
+
+
+# The baseline upload cannot be hoisted into a shared fixture: the
+# OVERWRITE=TRUE variant replaces the staged file, which would break the
+# FALSE variant's "content is still original" check. Each variant therefore
+# stages its own copy under its own stage_path.
+@pytest.mark.parametrize(
+    "overwrite, expected_status, expected_row",
+    [
+        (True, "UPLOADED", ("updated", "test", "data")),
+        (False, "SKIPPED", ("original", "test", "data")),
+    ],
+    ids=["true", "false"],
+)
+def test_should_only_replace_staged_file_when_overwrite_enabled(
+    put_get_connection, stage_path, overwrite, expected_status, expected_row
+):
+    with put_get_connection.cursor() as cursor:
 
         # Given File is uploaded to stage
         assert cursor is not None
-        stage_name, _ = create_temporary_stage_and_upload_file(
-            cursor,
-            "TEST_PUT_GET_OVERWRITE_TRUE",
-            original_file_path,
-            auto_compress=False,
-            overwrite=True,
+        upload_result = upload_file_to_stage(
+            cursor, stage_path, _ORIGINAL_FILE_PATH, auto_compress=False, overwrite=True
         )
+        assert upload_result[6] == "UPLOADED"
 
-        # When Updated file is uploaded with OVERWRITE set to true
+        # When Updated file is uploaded with the given OVERWRITE setting
         updated_upload_result = upload_file_to_stage(
-            cursor, stage_name, updated_file_path, auto_compress=False, overwrite=True
-        )
-
-        # Then UPLOADED status is returned
-        assert updated_upload_result[6] == "UPLOADED"
-
-        # And File was overwritten
-        cursor.execute(f"SELECT $1, $2, $3 FROM @{stage_name}")
-        result = cursor.fetchone()
-        assert result[0] == "updated"
-        assert result[1] == "test"
-        assert result[2] == "data"
-
-
-def test_should_not_overwrite_file_when_overwrite_is_set_to_false(connection):
-    original_file_path = (
-        shared_test_data_dir() / "overwrite" / "original" / "test_data.csv"
-    )
-    updated_file_path = (
-        shared_test_data_dir() / "overwrite" / "updated" / "test_data.csv"
-    )
-
-    with connection.cursor() as cursor:
-
-        # Given File is uploaded to stage
-        stage_name, _ = create_temporary_stage_and_upload_file(
             cursor,
-            "TEST_PUT_GET_OVERWRITE_FALSE",
-            original_file_path,
+            stage_path,
+            _UPDATED_FILE_PATH,
             auto_compress=False,
-            overwrite=True,
+            overwrite=overwrite,
         )
 
-        # When Updated file is uploaded with OVERWRITE set to false
-        updated_upload_result = upload_file_to_stage(
-            cursor, stage_name, updated_file_path, auto_compress=False, overwrite=False
-        )
-
-        # Then SKIPPED status is returned
-        assert updated_upload_result[6] == "SKIPPED"
-
-        cursor.execute(f"SELECT $1, $2, $3 FROM @{stage_name}")
+        # Then Expected status is returned
+        assert updated_upload_result[6] == expected_status
 
-        # And File was not overwritten
-        result = cursor.fetchone()
-        assert result[0] == "original"
-        assert result[1] == "test"
-        assert result[2] == "data"
+        # And Stage content matches the expected file
+        cursor.execute(f"SELECT $1, $2, $3 FROM @{stage_path}")
+        assert cursor.fetchone() == expected_row
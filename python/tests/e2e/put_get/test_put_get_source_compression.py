@@ -1,13 +1,17 @@
 import pytest
 from pathlib import Path
 
-from tests.e2e.put_get.put_get_helper import (
-    as_file_uri,
-    create_temporary_stage,
-)
+from tests.e2e.put_get.put_get_helper import put_stmt
 from tests.compatibility import NEW_DRIVER_ONLY, OLD_DRIVER_ONLY
 from tests.utils import shared_test_data_dir
 
+# Flavor checks are constant for the run; resolve them once at import
+# instead of inside each parametrized test body.
+_OLD_DRIVER_BD2 = OLD_DRIVER_ONLY("BD#2")
+_NEW_DRIVER_BD2 = NEW_DRIVER_ONLY("BD#2")
+_OLD_DRIVER_BD4 = OLD_DRIVER_ONLY("BD#4")
+_NEW_DRIVER_BD4 = NEW_DRIVER_ONLY("BD#4")
+
 
 @pytest.mark.parametrize(
     "expected_compression,filename",
@@ -20,25 +24,25 @@ from tests.utils import shared_test_data_dir
     ],
 )
 def test_should_auto_detect_standard_compression_types_when_source_compression_set_to_auto_detect(
-    connection, expected_compression, filename
+    put_get_connection, stage_path, expected_compression, filename
 ):
-    with connection.cursor() as cursor:
+    with put_get_connection.cursor() as cursor:
         # Given Snowflake client is logged in
         assert cursor is not None
 
         # And File with standard type (GZIP, BZIP2, BROTLI, ZSTD, DEFLATE)
-        stage_name, test_file_path = create_stage_and_get_compression_file(
-            cursor, f"TEST_STAGE_{expected_compression}", expected_compression
-        )
+        test_file_path = get_compression_test_file_path(expected_compression)
 
         # When File is uploaded with SOURCE_COMPRESSION set to AUTO_DETECT
-        put_command = f"PUT 'file://{as_file_uri(test_file_path)}' @{stage_name} SOURCE_COMPRESSION=AUTO_DETECT"
+        put_command = put_stmt(
+            stage_path, test_file_path, source_compression="AUTO_DETECT"
+        )
         cursor.execute(put_command)
         result = cursor.fetchone()
 
         # Then Target compression has correct type and all PUT results are correct
         if expected_compression == "DEFLATE":
-            if OLD_DRIVER_ONLY("BD#2"):
+            if _OLD_DRIVER_BD2:
                 expected_target = f"{filename}.gz"
                 assert_put_compression_result(
                     result,
@@ -47,7 +51,7 @@ def test_should_auto_detect_standard_compression_types_when_source_compression_s
                     expected_target,
                     "GZIP",
                 )
-            elif NEW_DRIVER_ONLY("BD#2"):
+            elif _NEW_DRIVER_BD2:
                 assert_put_compression_result(
                     result,
                     filename,
@@ -70,40 +74,31 @@ def test_should_auto_detect_standard_compression_types_when_source_compression_s
     [
         ("GZIP", "test_data.csv.gz"),
         ("BZIP2", "test_data.csv.bz2"),
-        ("BROTLI", "test_data.csv.br"),
+        # Only the new driver supports explicit BROTLI (BD#3); the old
+        # driver's failure mode has its own test below, so the inapplicable
+        # variant is skipped before any PUT runs.
+        pytest.param("BROTLI", "test_data.csv.br", marks=pytest.mark.skip_reference),
         ("ZSTD", "test_data.csv.zst"),
         ("DEFLATE", "test_data.csv.deflate"),
         ("RAW_DEFLATE", "test_data.csv.raw_deflate"),
     ],
 )
 def test_should_upload_compressed_files_with_source_compression_set_to_explicit_types(
-    connection, compression, filename
+    put_get_connection, stage_path, compression, filename
 ):
-    with connection.cursor() as cursor:
+    with put_get_connection.cursor() as cursor:
         # Given Snowflake client is logged in
         assert cursor is not None
 
         # And File with standard type (GZIP, BZIP2, BROTLI, ZSTD, DEFLATE, RAW_DEFLATE)
-        stage_name, test_file_path = create_stage_and_get_compression_file(
-            cursor, f"TEST_STAGE_{compression}", compression
-        )
+        test_file_path = get_compression_test_file_path(compression)
 
         # When File is uploaded with SOURCE_COMPRESSION set to explicit type
-        put_command = f"PUT 'file://{as_file_uri(test_file_path)}' @{stage_name} SOURCE_COMPRESSION={compression}"
-
-        if compression == "BROTLI":
-            if OLD_DRIVER_ONLY("BD#3"):
-                with pytest.raises(Exception) as exc_info:
-                    cursor.execute(put_command)
-                assert "253007" in str(exc_info.value)
-                assert "Feature is not supported" in str(exc_info.value)
-                return
-            elif NEW_DRIVER_ONLY("BD#3"):
-                cursor.execute(put_command)
-                result = cursor.fetchone()
-        else:
-            cursor.execute(put_command)
-            result = cursor.fetchone()
+        put_command = put_stmt(
+            stage_path, test_file_path, source_compression=compression
+        )
+        cursor.execute(put_command)
+        result = cursor.fetchone()
 
         # Then Target compression has correct type and all PUT results are correct
         assert_put_compression_result(
@@ -111,21 +106,45 @@ def test_should_upload_compressed_files_with_source_compression_set_to_explicit_
         )
 
 
+@pytest.mark.skip_universal
+def test_should_fail_brotli_upload_with_explicit_source_compression_on_old_driver(
+    put_get_connection, stage_path
+):
+    with put_get_connection.cursor() as cursor:
+        # Given Snowflake client is logged in
+        assert cursor is not None
+
+        # And File compressed with BROTLI
+        test_file_path = get_compression_test_file_path("BROTLI")
+
+        # When File is uploaded with SOURCE_COMPRESSION set to BROTLI
+        put_command = put_stmt(stage_path, test_file_path, source_compression="BROTLI")
+
+        # Then The old driver rejects the feature (BD#3)
+        with pytest.raises(Exception) as exc_info:
+            cursor.execute(put_command)
+        assert "253007" in str(exc_info.value)
+        assert "Feature is not supported" in str(exc_info.value)
+
+
 def test_should_not_compress_file_when_source_compression_set_to_auto_detect_and_auto_compress_set_to_false(
-    connection,
+    put_get_connection, stage_path
 ):
-    with connection.cursor() as cursor:
+    with put_get_connection.cursor() as cursor:
         # Given Snowflake client is logged in
         assert cursor is not None
 
         # And Uncompressed file
-        stage_name, test_file_path = create_stage_and_get_compression_file(
-            cursor, "TEST_STAGE_NONE_NO_AUTO_COMPRESS", "NONE"
-        )
+        test_file_path = get_compression_test_file_path("NONE")
         filename = "test_data.csv"
 
         # When File is uploaded with SOURCE_COMPRESSION set to AUTO_DETECT and AUTO_COMPRESS set to FALSE
-        put_command = f"PUT 'file://{as_file_uri(test_file_path)}' @{stage_name} SOURCE_COMPRESSION=AUTO_DETECT AUTO_COMPRESS=FALSE"
+        put_command = put_stmt(
+            stage_path,
+            test_file_path,
+            source_compression="AUTO_DETECT",
+            auto_compress=False,
+        )
         cursor.execute(put_command)
         result = cursor.fetchone()
 
@@ -134,20 +153,20 @@ def test_should_not_compress_file_when_source_compression_set_to_auto_detect_and
 
 
 def test_should_not_compress_file_when_source_compression_set_to_none_and_auto_compress_set_to_false(
-    connection,
+    put_get_connection, stage_path
 ):
-    with connection.cursor() as cursor:
+    with put_get_connection.cursor() as cursor:
         # Given Snowflake client is logged in
         assert cursor is not None
 
         # And Uncompressed file
-        stage_name, test_file_path = create_stage_and_get_compression_file(
-            cursor, "TEST_STAGE_NONE_NO_AUTO_COMPRESS", "NONE"
-        )
+        test_file_path = get_compression_test_file_path("NONE")
         filename = "test_data.csv"
 
         # When File is uploaded with SOURCE_COMPRESSION set to NONE and AUTO_COMPRESS set to FALSE
-        put_command = f"PUT 'file://{as_file_uri(test_file_path)}' @{stage_name} SOURCE_COMPRESSION=NONE AUTO_COMPRESS=FALSE"
+        put_command = put_stmt(
+            stage_path, test_file_path, source_compression="NONE", auto_compress=False
+        )
         cursor.execute(put_command)
         result = cursor.fetchone()
 
@@ -156,20 +175,23 @@ def test_should_not_compress_file_when_source_compression_set_to_none_and_auto_c
 
 
 def test_should_compress_uncompressed_file_when_source_compression_set_to_auto_detect_and_auto_compress_set_to_true(
-    connection,
+    put_get_connection, stage_path
 ):
-    with connection.cursor() as cursor:
+    with put_get_connection.cursor() as cursor:
         # Given Snowflake client is logged in
         assert cursor is not None
 
         # And Uncompressed file
-        stage_name, test_file_path = create_stage_and_get_compression_file(
-            cursor, "TEST_STAGE_AUTO_COMPRESS", "NONE"
-        )
+        test_file_path = get_compression_test_file_path("NONE")
         filename = "test_data.csv"
 
         # When File is uploaded with SOURCE_COMPRESSION set to AUTO_DETECT and AUTO_COMPRESS set to TRUE
-        put_command = f"PUT 'file://{as_file_uri(test_file_path)}' @{stage_name} SOURCE_COMPRESSION=AUTO_DETECT AUTO_COMPRESS=TRUE"
+        put_command = put_stmt(
+            stage_path,
+            test_file_path,
+            source_compression="AUTO_DETECT",
+            auto_compress=True,
+        )
         cursor.execute(put_command)
         result = cursor.fetchone()
 
@@ -179,20 +201,20 @@ def test_should_compress_uncompressed_file_when_source_compression_set_to_auto_d
 
 
 def test_should_compress_uncompressed_file_when_source_compression_set_to_none_and_auto_compress_set_to_true(
-    connection,
+    put_get_connection, stage_path
 ):
-    with connection.cursor() as cursor:
+    with put_get_connection.cursor() as cursor:
         # Given Snowflake client is logged in
         assert cursor is not None
 
         # And Uncompressed file
-        stage_name, test_file_path = create_stage_and_get_compression_file(
-            cursor, "TEST_STAGE_NONE_AUTO_COMPRESS", "NONE"
-        )
+        test_file_path = get_compression_test_file_path("NONE")
         filename = "test_data.csv"
 
         # When File is uploaded with SOURCE_COMPRESSION set to NONE and AUTO_COMPRESS set to TRUE
-        put_command = f"PUT 'file://{as_file_uri(test_file_path)}' @{stage_name} SOURCE_COMPRESSION=NONE AUTO_COMPRESS=TRUE"
+        put_command = put_stmt(
+            stage_path, test_file_path, source_compression="NONE", auto_compress=True
+        )
         cursor.execute(put_command)
         result = cursor.fetchone()
 
@@ -201,32 +223,49 @@ def test_should_compress_uncompressed_file_when_source_compression_set_to_none_a
         assert_put_compression_result(result, filename, "NONE", expected_target, "GZIP")
 
 
-def test_should_return_error_for_unsupported_compression_type(connection):
-    with connection.cursor() as cursor:
+def test_should_return_error_for_unsupported_compression_type(
+    put_get_connection, stage_path
+):
+    with put_get_connection.cursor() as cursor:
         # Given Snowflake client is logged in
         assert cursor is not None
 
         # And File compressed with unsupported format
-        stage_name, test_file_path = create_stage_and_get_compression_file(
-            cursor, "TEST_STAGE_UNSUPPORTED", "LZMA"
-        )
+        test_file_path = get_compression_test_file_path("LZMA")
         filename = "test_data.csv.xz"
 
         # When File is uploaded with SOURCE_COMPRESSION set to AUTO_DETECT
-        put_command = f"PUT 'file://{as_file_uri(test_file_path)}' @{stage_name} SOURCE_COMPRESSION=AUTO_DETECT"
+        put_command = put_stmt(
+            stage_path, test_file_path, source_compression="AUTO_DETECT"
+        )
 
         # Then Unsupported compression error is thrown
         with pytest.raises(Exception) as exc_info:
             cursor.execute(put_command)
 
-        if NEW_DRIVER_ONLY("BD#4"):
+        if _NEW_DRIVER_BD4:
             assert "Unsupported compression type" in str(exc_info.value)
 
-        if OLD_DRIVER_ONLY("BD#4"):
+        if _OLD_DRIVER_BD4:
             assert "253007" in str(exc_info.value)
             assert "Feature is not supported" in str(exc_info.value)
 
 
+# Compression type -> fixture path, resolved once at import instead of
+# rebuilding the map and the Path on every parametrize cell.
+_COMPRESSION_DIR = shared_test_data_dir() / "compression"
+_COMPRESSION_FILE_PATHS = {
+    "GZIP": _COMPRESSION_DIR / "test_data.csv.gz",
+    "BZIP2": _COMPRESSION_DIR / "test_data.csv.bz2",
+    "BROTLI": _COMPRESSION_DIR / "test_data.csv.br",
+    "ZSTD": _COMPRESSION_DIR / "test_data.csv.zst",
+    "DEFLATE": _COMPRESSION_DIR / "test_data.csv.deflate",
+    "RAW_DEFLATE": _COMPRESSION_DIR / "test_data.csv.raw_deflate",
+    "NONE": _COMPRESSION_DIR / "test_data.csv",
+    "LZMA": _COMPRESSION_DIR / "test_data.csv.xz",
+}
+
+
 def get_compression_test_file_path(compression_type: str) -> Path:
     """
     Get the path for a test file with the specified compression type.
@@ -240,41 +279,10 @@ def get_compression_test_file_path(compression_type: str) -> Path:
     Raises:
         ValueError: If compression type is not supported
     """
-    compression_map = {
-        "GZIP": "test_data.csv.gz",
-        "BZIP2": "test_data.csv.bz2",
-        "BROTLI": "test_data.csv.br",
-        "ZSTD": "test_data.csv.zst",
-        "DEFLATE": "test_data.csv.deflate",
-        "RAW_DEFLATE": "test_data.csv.raw_deflate",
-        "NONE": "test_data.csv",
-        "LZMA": "test_data.csv.xz",
-    }
-
-    filename = compression_map.get(compression_type.upper())
-    if not filename:
-        raise ValueError(f"Unsupported compression type: {compression_type}")
-
-    return shared_test_data_dir() / "compression" / filename
-
-
-def create_stage_and_get_compression_file(
-    cursor, stage_prefix: str, compression_type: str
-):
-    """
-    Create a temporary stage and get the compression test file path.
-
-    Args:
-        cursor: Database cursor to use
-        stage_prefix: Prefix for the temporary stage name
-        compression_type: Compression type (GZIP, BZIP2, BROTLI, ZSTD, DEFLATE, RAW_DEFLATE, NONE, LZMA)
-
-    Returns:
-        tuple: (stage_name, test_file_path)
-    """
-    stage_name = create_temporary_stage(cursor, stage_prefix)
-    test_file_path = get_compression_test_file_path(compression_type)
-    return stage_name, test_file_path
+    try:
+        return _COMPRESSION_FILE_PATHS[compression_type.upper()]
+    except KeyError:
+        raise ValueError(f"Unsupported compression type: {compression_type}") from None
 
 
 def assert_put_compression_result(
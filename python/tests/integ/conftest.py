@@ -0,0 +1,55 @@
+"""
+pytest fixtures shared by the integration test modules.
+"""
+
+import copy
+from unittest.mock import Mock
+
+import pytest
+
+from ..compatibility import is_old_driver
+from ..connector_factory import create_connection_with_adapter
+
+
+@pytest.fixture(scope="module")
+def module_connection(connector_adapter):
+    """One real connection per module.
+
+    The connection handshake dominates integration-test wall time, so share
+    a single live connection across a module instead of re-establishing it
+    for every test.
+    """
+    with create_connection_with_adapter(connector_adapter) as conn:
+        yield conn
+
+
+@pytest.fixture
+def connection(module_connection, connector_adapter):
+    """Per-test view of the module-scoped connection.
+
+    For the universal driver, close() only flips the copy's Python-side
+    state, so a shallow copy keeps the underlying session shared across
+    the module. The reference driver's close() tears down the real
+    session — which the copy shares — so each test gets its own
+    connection there.
+    """
+    if is_old_driver():
+        with create_connection_with_adapter(connector_adapter) as conn:
+            yield conn
+        return
+    conn = copy.copy(module_connection)
+    conn._closed = False
+    yield conn
+
+
+@pytest.fixture(scope="module")
+def reusable_mock():
+    """One Mock instance shared across a module; construction is not free."""
+    return Mock()
+
+
+@pytest.fixture
+def fresh_mock(reusable_mock):
+    """The module Mock with call state (and side_effect) reset per test."""
+    reusable_mock.reset_mock(return_value=True, side_effect=True)
+    return reusable_mock
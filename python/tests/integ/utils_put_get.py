@@ -1,9 +1,7 @@
-import brotli
-import pytest
-import uuid
-import zstandard as zstd
+import itertools
+import os
+from functools import cache
 from pathlib import Path
-from python.cursor import Cursor
 
 GET_ROW_FILE_IDX = 0
 GET_ROW_SIZE_IDX = 1
@@ -25,11 +23,20 @@ LS_ROW_MD5_IDX = 2
 LS_ROW_LAST_MODIFIED_IDX = 3
 
 
+@cache
 def as_file_uri(p: Path) -> str:
-    return p.as_posix().replace("\\", "/")
+    # Pure and deterministic, so memoize: the same paths are re-formatted
+    # into PUT/GET command strings over and over across a test run.
+    # as_posix() already yields forward slashes on every platform
+    # (including WindowsPath), so no backslash fixup is needed.
+    return p.as_posix()
+
+
+# pid + counter uniqueness, avoiding uuid4's urandom read per call
+_stage_counter = itertools.count()
 
 
 def create_temporary_stage(cursor, prefix: str) -> str:
-    stage_name = f"{prefix}_{uuid.uuid4().hex}".upper()
+    stage_name = f"{prefix}_{os.getpid():x}_{next(_stage_counter):x}".upper()
     cursor.execute(f"CREATE TEMPORARY STAGE {stage_name}")
     return stage_name
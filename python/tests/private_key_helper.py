@@ -9,6 +9,9 @@ from .utils import repo_root
 # Global registry to keep TempPrivateKeyFile objects alive
 _temp_key_files_registry = []
 
+# Cached key file path so every connection attempt reuses the same material
+_cached_private_key_path: Optional[str] = None
+
 
 class TempPrivateKeyFile:
     """
@@ -49,15 +52,22 @@ class TempPrivateKeyFile:
 
 def get_private_key_from_parameters() -> str:
     """Get private key file path from test parameters.
-    
-    Creates a temporary file that persists until program exit.
-    
+
+    Creates a temporary file that persists until program exit. The file is
+    created once and reused by subsequent calls, so every connection attempt
+    in a test run shares the same key material instead of re-materializing
+    the PEM per connection.
+
     Returns:
         Path to the temporary private key file
-        
+
     Raises:
         RuntimeError: If SNOWFLAKE_TEST_PRIVATE_KEY_CONTENTS not found
     """
+    global _cached_private_key_path
+    if _cached_private_key_path is not None:
+        return _cached_private_key_path
+
     test_params = get_test_parameters()
     private_key_contents = test_params.get("SNOWFLAKE_TEST_PRIVATE_KEY_CONTENTS")
     
@@ -69,7 +79,8 @@ def get_private_key_from_parameters() -> str:
     temp_file = TempPrivateKeyFile(private_key_contents)
     # Keep object alive so file persists until program exit
     _temp_key_files_registry.append(temp_file)
-    return temp_file.path()
+    _cached_private_key_path = temp_file.path()
+    return _cached_private_key_path
 
 
 def get_private_key_password() -> Optional[str]:
@@ -4,15 +4,23 @@ Tests for PEP 249 module interface.
 
 import snowflake.ud_connector as pep249_dbapi
 
+# Only the cheap symbols are imported at module scope; naming Connection,
+# Cursor or connect here would trigger the package's lazy loading (and the
+# whole driver import chain) during pytest collection. Tests that need
+# them go through the pep249_dbapi namespace at run time.
 from snowflake.ud_connector import (
-    apilevel, threadsafety, paramstyle, connect,
-    Connection, Cursor, Warning, Error, InterfaceError, DatabaseError,
+    apilevel, threadsafety, paramstyle,
+    Warning, Error, InterfaceError, DatabaseError,
     DataError, OperationalError, IntegrityError, InternalError,
     ProgrammingError, NotSupportedError, Date, Time, Timestamp,
     DateFromTicks, TimeFromTicks, TimestampFromTicks, Binary,
     STRING, BINARY, NUMBER, DATETIME, ROWID
 )
 
+# Sentinel for single-lookup existence checks; hasattr-then-getattr would
+# dispatch the module __getattr__ twice per symbol.
+_MISSING = object()
+
 
 class TestModuleConstants:
     """Test module-level constants required by PEP 249."""
@@ -20,13 +28,11 @@ class TestModuleConstants:
     def test_apilevel_constant(self):
         """Test apilevel constant."""
         assert apilevel == "2.0"
-        assert hasattr(pep249_dbapi, 'apilevel')
         assert pep249_dbapi.apilevel == "2.0"
     
     def test_threadsafety_constant(self):
         """Test threadsafety constant."""
         assert threadsafety == 1
-        assert hasattr(pep249_dbapi, 'threadsafety')
         assert pep249_dbapi.threadsafety == 1
         assert isinstance(threadsafety, int)
         assert 0 <= threadsafety <= 3  # Valid range according to PEP 249
@@ -34,7 +40,6 @@ class TestModuleConstants:
     def test_paramstyle_constant(self):
         """Test paramstyle constant."""
         assert paramstyle == "format"
-        assert hasattr(pep249_dbapi, 'paramstyle')
         assert pep249_dbapi.paramstyle == "format"
         
         # Valid paramstyle values according to PEP 249
@@ -47,25 +52,23 @@ class TestModuleConnectFunction:
     
     def test_connect_function_exists(self):
         """Test that connect function exists and is callable."""
-        assert hasattr(pep249_dbapi, 'connect')
         assert callable(pep249_dbapi.connect)
-        assert callable(connect)
 
     def test_connect_returns_connection(self, connection):
         """Test that connect returns a Connection object."""
-        assert isinstance(connection, Connection)
+        assert isinstance(connection, pep249_dbapi.Connection)
 
 class TestModuleExports:
     """Test that all required symbols are exported."""
     
     def test_connection_class_exported(self):
         """Test that Connection class is exported."""
-        assert hasattr(pep249_dbapi, 'Connection')
+        from snowflake.ud_connector.connection import Connection
         assert pep249_dbapi.Connection is Connection
     
     def test_cursor_class_exported(self):
         """Test that Cursor class is exported."""
-        assert hasattr(pep249_dbapi, 'Cursor')
+        from snowflake.ud_connector.cursor import Cursor
         assert pep249_dbapi.Cursor is Cursor
     
     def test_exception_classes_exported(self):
@@ -77,8 +80,8 @@ class TestModuleExports:
         ]
         
         for exc_class in exceptions:
-            assert hasattr(pep249_dbapi, exc_class.__name__)
-            assert getattr(pep249_dbapi, exc_class.__name__) is exc_class
+            exported = getattr(pep249_dbapi, exc_class.__name__, _MISSING)
+            assert exported is exc_class, f"'{exc_class.__name__}' not exported"
     
     def test_type_constructors_exported(self):
         """Test that type constructor functions are exported."""
@@ -88,15 +91,16 @@ class TestModuleExports:
         ]
         
         for constructor in constructors:
-            assert hasattr(pep249_dbapi, constructor.__name__)
-            assert getattr(pep249_dbapi, constructor.__name__) is constructor
+            exported = getattr(pep249_dbapi, constructor.__name__, _MISSING)
+            assert exported is constructor, f"'{constructor.__name__}' not exported"
     
     def test_type_objects_exported(self):
         """Test that type objects are exported."""
         type_object_names = ['STRING', 'BINARY', 'NUMBER', 'DATETIME', 'ROWID']
         
         for name in type_object_names:
-            assert hasattr(pep249_dbapi, name), f"Type object '{name}' not exported"
+            assert getattr(pep249_dbapi, name, _MISSING) is not _MISSING, \
+                f"Type object '{name}' not exported"
     
     def test_all_exports_defined(self):
         """Test that __all__ is properly defined."""
@@ -105,7 +109,8 @@ class TestModuleExports:
         
         # Check that all items in __all__ are actually available
         for name in pep249_dbapi.__all__:
-            assert hasattr(pep249_dbapi, name), f"Symbol '{name}' in __all__ but not available"
+            assert getattr(pep249_dbapi, name, _MISSING) is not _MISSING, \
+                f"Symbol '{name}' in __all__ but not available"
 
 
 class TestModuleDocumentation:
@@ -134,7 +139,8 @@ class TestPEP249Compliance:
         ]
         
         for attr in required_attrs:
-            assert hasattr(pep249_dbapi, attr), f"Required attribute '{attr}' missing"
+            assert getattr(pep249_dbapi, attr, _MISSING) is not _MISSING, \
+                f"Required attribute '{attr}' missing"
     
     def test_exception_hierarchy_compliance(self):
         """Test that exception hierarchy follows PEP 249."""
@@ -176,8 +182,8 @@ class TestPEP249Compliance:
         ]
         
         for method in required_methods:
-            assert hasattr(Connection, method), f"Connection missing required method '{method}'"
-            assert callable(getattr(Connection, method))
+            member = getattr(pep249_dbapi.Connection, method, None)
+            assert callable(member), f"Connection missing required method '{method}'"
     
     def test_cursor_interface_compliance(self):
         """Test that Cursor class has required methods."""
@@ -188,11 +194,12 @@ class TestPEP249Compliance:
         ]
         
         for method in required_methods:
-            assert hasattr(Cursor, method), f"Cursor missing required method '{method}'"
-            assert callable(getattr(Cursor, method))
+            member = getattr(pep249_dbapi.Cursor, method, None)
+            assert callable(member), f"Cursor missing required method '{method}'"
         
         # Test required attributes
         required_attrs = ['description', 'rowcount', 'arraysize']
         
         for attr in required_attrs:
-            assert hasattr(Cursor, attr), f"Cursor missing required attribute '{attr}'" 
\ No newline at end of file
+            assert getattr(pep249_dbapi.Cursor, attr, _MISSING) is not _MISSING, \
+                f"Cursor missing required attribute '{attr}'"
@@ -14,142 +14,111 @@ from snowflake.ud_connector.types import (
 
 class TestTypeConstructors:
     """Test type constructor functions."""
-    
-    def test_date_constructor(self):
-        """Test Date constructor."""
-        result = Date(2023, 12, 25)
-        assert isinstance(result, datetime.date)
-        assert result.year == 2023
-        assert result.month == 12
-        assert result.day == 25
-    
-    def test_time_constructor(self):
-        """Test Time constructor."""
-        result = Time(14, 30, 45)
-        assert isinstance(result, datetime.time)
-        assert result.hour == 14
-        assert result.minute == 30
-        assert result.second == 45
-    
-    def test_timestamp_constructor(self):
-        """Test Timestamp constructor."""
-        result = Timestamp(2023, 12, 25, 14, 30, 45)
-        assert isinstance(result, datetime.datetime)
-        assert result.year == 2023
-        assert result.month == 12
-        assert result.day == 25
-        assert result.hour == 14
-        assert result.minute == 30
-        assert result.second == 45
-    
-    def test_date_from_ticks(self):
-        """Test DateFromTicks constructor."""
-        ticks = time.time()
-        result = DateFromTicks(ticks)
-        assert isinstance(result, datetime.date)
-        # Should be approximately today's date
-        expected = datetime.date.fromtimestamp(ticks)
-        assert result == expected
-    
-    def test_time_from_ticks(self):
-        """Test TimeFromTicks constructor."""
-        ticks = time.time()
-        result = TimeFromTicks(ticks)
-        assert isinstance(result, datetime.time)
-        # Should be approximately current time
-        expected = datetime.datetime.fromtimestamp(ticks).time()
-        assert result == expected
-    
-    def test_timestamp_from_ticks(self):
-        """Test TimestampFromTicks constructor."""
-        ticks = time.time()
-        result = TimestampFromTicks(ticks)
-        assert isinstance(result, datetime.datetime)
-        # Should be approximately current timestamp
-        expected = datetime.datetime.fromtimestamp(ticks)
+
+    @pytest.mark.parametrize("ctor, args, cls, attrs", [
+        (Date, (2023, 12, 25), datetime.date,
+         {"year": 2023, "month": 12, "day": 25}),
+        (Time, (14, 30, 45), datetime.time,
+         {"hour": 14, "minute": 30, "second": 45}),
+        (Timestamp, (2023, 12, 25, 14, 30, 45), datetime.datetime,
+         {"year": 2023, "month": 12, "day": 25,
+          "hour": 14, "minute": 30, "second": 45}),
+    ], ids=["date", "time", "timestamp"])
+    def test_constructor(self, ctor, args, cls, attrs):
+        """Test the fixed-argument type constructors."""
+        result = ctor(*args)
+        assert isinstance(result, cls)
+        for attr_name, attr_value in attrs.items():
+            assert getattr(result, attr_name) == attr_value
+
+    @pytest.mark.parametrize("ctor, expected_fn", [
+        (DateFromTicks, datetime.date.fromtimestamp),
+        (TimeFromTicks, lambda ticks: datetime.datetime.fromtimestamp(ticks).time()),
+        (TimestampFromTicks, datetime.datetime.fromtimestamp),
+    ], ids=["date", "time", "timestamp"])
+    def test_from_ticks_constructor(self, ctor, expected_fn):
+        """Test the *FromTicks constructors against the datetime library."""
+        # PEP 249 ticks are whole seconds since the epoch; a fractional
+        # value would differ in sub-second precision between constructors.
+        ticks = int(time.time())
+        result = ctor(ticks)
+        expected = expected_fn(ticks)
+        assert isinstance(result, type(expected))
         assert result == expected
-    
+
     def test_binary_constructor_from_string(self):
         """Test Binary constructor with string input."""
         result = Binary("hello")
         assert isinstance(result, bytes)
         assert result == b"hello"
-    
+
     def test_binary_constructor_from_bytes(self):
         """Test Binary constructor with bytes input."""
         input_bytes = b"\x00\x01\x02\x03"
         result = Binary(input_bytes)
         assert isinstance(result, bytes)
         assert result == input_bytes
-    
-    def test_binary_constructor_from_list(self):
-        """Test Binary constructor with list input."""
-        input_list = [65, 66, 67]  # ABC
-        result = Binary(input_list)
+        # bytes input is returned without a copy (safe: bytes is immutable)
+        assert result is input_bytes
+
+    @pytest.mark.parametrize("raw", [
+        [65, 66, 67],  # ABC
+        (65, 66, 67),
+        bytearray(b"ABC"),
+        memoryview(b"ABC"),
+    ], ids=["list", "tuple", "bytearray", "memoryview"])
+    def test_binary_constructor_from_buffer_like(self, raw):
+        """Test Binary constructor with buffer-like inputs.
+
+        All four input shapes must go through the C-level bytes
+        constructor in one shot; this pins that no Python-level
+        per-element path creeps into Binary.
+        """
+        result = Binary(raw)
         assert isinstance(result, bytes)
         assert result == b"ABC"
 
 
 class TestTypeObjects:
     """Test type objects for database column type comparison."""
-    
+
     def test_dbapi_type_object_creation(self):
         """Test DBAPITypeObject creation."""
         type_obj = DBAPITypeObject("TYPE1", "TYPE2")
         assert type_obj.values == ("TYPE1", "TYPE2")
-    
+
     def test_dbapi_type_object_equality(self):
         """Test DBAPITypeObject equality comparison."""
         type_obj = DBAPITypeObject("TYPE1", "TYPE2")
-        
+
         assert type_obj == "TYPE1"
         assert type_obj == "TYPE2"
         assert not (type_obj == "TYPE3")
-    
+
     def test_dbapi_type_object_inequality(self):
         """Test DBAPITypeObject inequality comparison."""
         type_obj = DBAPITypeObject("TYPE1", "TYPE2")
-        
+
         assert not (type_obj != "TYPE1")
         assert not (type_obj != "TYPE2")
         assert type_obj != "TYPE3"
-    
-    def test_string_type_object(self):
-        """Test STRING type object."""
-        assert STRING == "STRING"
-        assert STRING == "VARCHAR"
-        assert STRING == "CHAR"
-        assert STRING == "TEXT"
-        assert not (STRING == "INTEGER")
-    
-    def test_binary_type_object(self):
-        """Test BINARY type object."""
-        assert BINARY == "BINARY"
-        assert BINARY == "VARBINARY"
-        assert BINARY == "BLOB"
-        assert not (BINARY == "TEXT")
-    
-    def test_number_type_object(self):
-        """Test NUMBER type object."""
-        assert NUMBER == "NUMBER"
-        assert NUMBER == "INTEGER"
-        assert NUMBER == "INT"
-        assert NUMBER == "FLOAT"
-        assert NUMBER == "DOUBLE"
-        assert NUMBER == "DECIMAL"
-        assert NUMBER == "NUMERIC"
-        assert not (NUMBER == "TEXT")
-    
-    def test_datetime_type_object(self):
-        """Test DATETIME type object."""
-        assert DATETIME == "DATETIME"
-        assert DATETIME == "DATE"
-        assert DATETIME == "TIME"
-        assert DATETIME == "TIMESTAMP"
-        assert not (DATETIME == "INTEGER")
-    
-    def test_rowid_type_object(self):
-        """Test ROWID type object."""
-        assert ROWID == "ROWID"
-        assert ROWID == "OID"
-        assert not (ROWID == "INTEGER") 
\ No newline at end of file
+
+    def test_dbapi_type_object_many_values(self):
+        """Test DBAPITypeObject comparison with a large value list."""
+        type_obj = DBAPITypeObject(*[f"TYPE{i}" for i in range(1000)])
+        assert type_obj == "TYPE999"
+        assert type_obj != "TYPE1000"
+
+    @pytest.mark.parametrize("type_obj, matching, non_matching", [
+        (STRING, ("STRING", "VARCHAR", "CHAR", "TEXT"), "INTEGER"),
+        (BINARY, ("BINARY", "VARBINARY", "BLOB"), "TEXT"),
+        (NUMBER, ("NUMBER", "INTEGER", "INT", "FLOAT",
+                  "DOUBLE", "DECIMAL", "NUMERIC"), "TEXT"),
+        (DATETIME, ("DATETIME", "DATE", "TIME", "TIMESTAMP"), "INTEGER"),
+        (ROWID, ("ROWID", "OID"), "INTEGER"),
+    ], ids=["string", "binary", "number", "datetime", "rowid"])
+    def test_module_type_object(self, type_obj, matching, non_matching):
+        """Test the predefined module-level type objects."""
+        for type_name in matching:
+            assert type_obj == type_name
+        assert not (type_obj == non_matching)
@@ -1,7 +1,9 @@
 import subprocess
+from functools import cache
 from pathlib import Path
 
 
+@cache
 def repo_root() -> Path:
     result = subprocess.run(
         ["git", "rev-parse", "--show-toplevel"],
@@ -15,5 +17,6 @@ def repo_root() -> Path:
     raise RuntimeError("Failed to determine repository root")
 
 
+@cache
 def shared_test_data_dir() -> Path:
     return repo_root() / "tests" / "test_data" / "generated_test_data"